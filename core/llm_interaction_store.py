@@ -4,10 +4,16 @@ LLM interaction artifact writer for the rebuilt scenario mainline.
 
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    _orjson = None
+
 from core.artifact_index import (
     default_raw_scope_for_run_mode,
     normalize_artifact_scope,
@@ -38,6 +44,17 @@ def _sanitize_json_value(value: Any) -> Any:
     return value
 
 
+def _dumps_json(value: Any) -> bytes:
+    payload = _sanitize_json_value(value)
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(payload, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            # Types orjson rejects (e.g. ints wider than 64 bits) fall back to stdlib json
+            pass
+    return json.dumps(payload, indent=2, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
 class LLMInteractionStore:
     """Persist request/response artifacts under mode-scoped directories."""
 
@@ -102,28 +119,12 @@ class LLMInteractionStore:
 
         if request is not None:
             req_path = os.path.join(target_dir, f"{prefix}_req.json")
-            with open(req_path, "w", encoding="utf-8") as f:
-                import json
-
-                json.dump(
-                    _sanitize_json_value(request),
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    allow_nan=False,
-                )
+            with open(req_path, "wb") as f:
+                f.write(_dumps_json(request))
 
         if response is not None:
             resp_path = os.path.join(target_dir, f"{prefix}_resp.json")
-            with open(resp_path, "w", encoding="utf-8") as f:
-                import json
-
-                json.dump(
-                    _sanitize_json_value(response),
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    allow_nan=False,
-                )
+            with open(resp_path, "wb") as f:
+                f.write(_dumps_json(response))
 
         return prefix
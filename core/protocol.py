@@ -60,6 +60,12 @@ class Vector3D(BaseModel):
         """转换为numpy数组"""
         return np.array([self.x, self.y, self.z])
 
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """支持 np.asarray(vector) 直接转换（总是新建数组，无法零拷贝）"""
+        if copy is False:
+            raise ValueError("Vector3D 无法零拷贝转换为 numpy 数组")
+        return np.array((self.x, self.y, self.z), dtype=dtype or np.float64)
+
     @classmethod
     def from_array(cls, arr: np.ndarray) -> 'Vector3D':
         """从numpy数组创建"""
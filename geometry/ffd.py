@@ -17,6 +17,18 @@ from core.exceptions import GeometryError
 
 logger = get_logger("ffd")
 
+# 单位立方体8个顶点的偏移系数(与 deform_component 的顶点顺序一致)
+_BOX_CORNER_OFFSETS = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+    [1.0, 1.0, 0.0],
+    [1.0, 0.0, 1.0],
+    [0.0, 1.0, 1.0],
+    [1.0, 1.0, 1.0],
+])
+
 
 @dataclass
 class ControlPoint:
@@ -55,7 +67,7 @@ class FFDDeformer:
     其中 B_i^n(t) = C(n,i) * t^i * (1-t)^(n-i) 是Bernstein基函数
     """
 
-    def __init__(self, nx: int = 3, ny: int = 3, nz: int = 3):
+    def __init__(self, nx: int = 3, ny: int = 3, nz: int = 3, backend: str = "numpy"):
         """
         初始化FFD变形器
 
@@ -63,6 +75,9 @@ class FFDDeformer:
             nx: x方向控制点数量
             ny: y方向控制点数量
             nz: z方向控制点数量
+            backend: 插值计算后端, "numpy"(默认) 或 "cupy"(GPU, 适用于大规模点云)。
+                cupy 后端的输入输出仍是主机端 numpy 数组: 每次调用上传一次参数坐标
+                (N, 3)、下载一次结果; 控制网格常驻设备, 仅在被修改后重新上传
         """
         if nx < 2 or ny < 2 or nz < 2:
             raise GeometryError("控制点数量必须至少为2")
@@ -70,9 +85,51 @@ class FFDDeformer:
         self.nx = nx
         self.ny = ny
         self.nz = nz
+        self.backend = backend
         self.lattice: Optional[FFDLattice] = None
+        self._xp = self._resolve_array_module(backend)
+        # cupy 后端: 控制网格的设备端副本及其对应的主机端快照
+        self._device_control_points: Any = None
+        self._device_control_points_snapshot: Optional[np.ndarray] = None
+        self._axis_basis = tuple(self._select_axis_basis(n, self._xp) for n in (nx, ny, nz))
 
-        logger.info(f"FFD变形器初始化: {nx}x{ny}x{nz} 控制点网格")
+        logger.info(f"FFD变形器初始化: {nx}x{ny}x{nz} 控制点网格, 后端={backend}")
+
+    @staticmethod
+    def _resolve_array_module(backend: str) -> Any:
+        """根据后端名称返回数组模块(numpy 或 cupy)"""
+        if backend == "numpy":
+            return np
+        if backend == "cupy":
+            try:
+                import cupy
+            except ImportError as e:
+                raise GeometryError(f"CuPy 不可用, 无法使用 cupy 后端: {e}")
+            return cupy
+        raise GeometryError(f"未知的FFD计算后端: {backend}")
+
+    def _to_host(self, array: Any) -> np.ndarray:
+        """将后端数组转回主机端 numpy 数组"""
+        if self._xp is np:
+            return array
+        return self._xp.asnumpy(array)
+
+    def _control_points_on_backend(self) -> Any:
+        """
+        返回后端上的控制网格
+
+        cupy 后端在调用之间保留设备端副本, 仅当主机端控制点被修改
+        (deform / set_control_point 等原地更新)时才重新上传。
+        """
+        host = self.lattice.control_points
+        if self._xp is np:
+            return host
+        if (self._device_control_points is None
+                or self._device_control_points_snapshot is None
+                or not np.array_equal(self._device_control_points_snapshot, host)):
+            self._device_control_points = self._xp.asarray(host)
+            self._device_control_points_snapshot = host.copy()
+        return self._device_control_points
 
     def create_lattice(self, bbox_min: np.ndarray, bbox_max: np.ndarray,
                        margin: float = 0.1) -> FFDLattice:
@@ -150,30 +207,62 @@ class FFDDeformer:
         if self.lattice is None:
             raise GeometryError("FFD网格未初始化")
 
-        N = parametric.shape[0]
-        world_points = np.zeros((N, 3))
+        xp = self._xp
+        basis_u, basis_v, basis_w = self._basis_tables(parametric)
+
+        # P(u,v,w) = Σ Σ Σ B_i(u) * B_j(v) * B_k(w) * P_ijk
+        world_points = xp.einsum(
+            'ni,nj,nk,ijkd->nd',
+            basis_u, basis_v, basis_w, self._control_points_on_backend(),
+            optimize=True,
+        )
 
-        # 对每个点进行Bernstein插值
-        for idx in range(N):
-            u, v, w = parametric[idx]
+        return self._to_host(world_points)
 
-            # 计算Bernstein基函数
-            point = np.zeros(3)
-            for i in range(self.nx):
-                for j in range(self.ny):
-                    for k in range(self.nz):
-                        # Bernstein多项式
-                        B_i = self._bernstein(self.nx - 1, i, u)
-                        B_j = self._bernstein(self.ny - 1, j, v)
-                        B_k = self._bernstein(self.nz - 1, k, w)
+    def _basis_tables(self, parametric: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        计算三个轴向的Bernstein基函数表
 
-                        # 加权求和
-                        weight = B_i * B_j * B_k
-                        point += weight * self.lattice.control_points[i, j, k]
+        Args:
+            parametric: 参数空间坐标 (N, 3)
 
-            world_points[idx] = point
+        Returns:
+            (B_u, B_v, B_w), 形状分别为 (N, nx), (N, ny), (N, nz)
+        """
+        parametric = self._xp.asarray(parametric, dtype=float)
+        return (
+            self._axis_basis[0](parametric[:, 0]),
+            self._axis_basis[1](parametric[:, 1]),
+            self._axis_basis[2](parametric[:, 2]),
+        )
 
-        return world_points
+    @staticmethod
+    def _select_axis_basis(n_points: int, xp: Any = np):
+        """
+        按轴向控制点数量选择基函数核
+
+        默认3个控制点(二次Bernstein)使用展开的闭式核, 其余走通用实现。
+        """
+        if n_points == 3:
+            def _quadratic_basis(t: np.ndarray) -> np.ndarray:
+                # [(1-t)^2, 2t(1-t), t^2], 返回 (N, 3)
+                s = 1.0 - t
+                return xp.stack((s * s, 2.0 * t * s, t * t), axis=1)
+
+            return _quadratic_basis
+
+        degree = n_points - 1
+        exponents = xp.arange(n_points)
+        coeffs = xp.asarray(
+            [FFDDeformer._binomial_coefficient(degree, i) for i in range(n_points)],
+            dtype=float,
+        )
+
+        def _generic_basis(t: np.ndarray) -> np.ndarray:
+            t = t[:, None]
+            return coeffs * (t ** exponents) * ((1.0 - t) ** (degree - exponents))
+
+        return _generic_basis
 
     def deform(self, points: np.ndarray, control_point_displacements: Dict[Tuple[int, int, int], np.ndarray]) -> np.ndarray:
         """
@@ -211,6 +300,44 @@ class FFDDeformer:
 
         return deformed_points
 
+    def deform_batch(self, points: np.ndarray, displacement_fields: np.ndarray) -> np.ndarray:
+        """
+        对同一点集批量评估多组控制点位移场
+
+        基函数表只计算一次, 与全部K组控制网格在一次einsum中收缩。
+        与 deform 不同, 本方法不修改当前控制点。
+
+        Args:
+            points: 原始点集 (N, 3)
+            displacement_fields: 控制点位移场 (K, nx, ny, nz, 3)
+
+        Returns:
+            变形后的点集 (K, N, 3)
+        """
+        if self.lattice is None:
+            raise GeometryError("FFD网格未初始化")
+
+        displacement_fields = np.asarray(displacement_fields, dtype=float)
+        expected_shape = (self.nx, self.ny, self.nz, 3)
+        if displacement_fields.ndim != 5 or displacement_fields.shape[1:] != expected_shape:
+            raise GeometryError(
+                f"位移场形状应为 (K, {self.nx}, {self.ny}, {self.nz}, 3), "
+                f"实际为 {displacement_fields.shape}"
+            )
+
+        xp = self._xp
+        parametric = self.world_to_parametric(np.asarray(points, dtype=float))
+        basis_u, basis_v, basis_w = self._basis_tables(parametric)
+        control_grids = self._control_points_on_backend()[None] + xp.asarray(displacement_fields)
+
+        deformed = xp.einsum(
+            'ni,nj,nk,bijkd->bnd',
+            basis_u, basis_v, basis_w, control_grids,
+            optimize=True,
+        )
+
+        return self._to_host(deformed)
+
     def deform_component(self, component_geometry: Any,
                         control_point_displacements: Dict[Tuple[int, int, int], np.ndarray]) -> Any:
         """
@@ -224,24 +351,9 @@ class FFDDeformer:
             变形后的组件几何对象
         """
         # 获取组件的8个顶点
-        pos = np.array([component_geometry.position.x,
-                       component_geometry.position.y,
-                       component_geometry.position.z])
-        dim = np.array([component_geometry.dimensions.x,
-                       component_geometry.dimensions.y,
-                       component_geometry.dimensions.z])
-
-        # 构建8个顶点
-        vertices = np.array([
-            pos,
-            pos + [dim[0], 0, 0],
-            pos + [0, dim[1], 0],
-            pos + [0, 0, dim[2]],
-            pos + [dim[0], dim[1], 0],
-            pos + [dim[0], 0, dim[2]],
-            pos + [0, dim[1], dim[2]],
-            pos + dim
-        ])
+        pos = np.asarray(component_geometry.position)
+        dim = np.asarray(component_geometry.dimensions)
+        vertices = pos + dim * _BOX_CORNER_OFFSETS
 
         # 变形顶点
         deformed_vertices = self.deform(vertices, control_point_displacements)
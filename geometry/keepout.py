@@ -4,12 +4,15 @@ AABB六面切分算法 - Keep-out区域处理
 从layout3dcube迁移
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import numpy as np
+from core.logger import get_logger
 from geometry.schema import AABB, EnvelopeGeometry, Part
 from geometry.geometry_proxy import shell_interior_proxy_entries_from_shell_spec
 from geometry.shell_spec import aperture_proxy_plans, resolve_shell_spec_from_mapping
 
+logger = get_logger(__name__)
+
 
 def boxes_overlap(A: AABB, B: AABB) -> bool:
     """判断两个AABB是否重叠"""
@@ -91,10 +94,75 @@ def subtract_box(A: AABB, B: AABB) -> List[AABB]:
     return pieces
 
 
+def _subtract_box_batch(
+    bins_min: np.ndarray,
+    bins_max: np.ndarray,
+    ko_min: np.ndarray,
+    ko_max: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量AABB盒差：对 (M,3) 的子容器数组同时减去同一个禁区
+
+    与 subtract_box 逐行等价（切片顺序、体积过滤一致），
+    各行之间互不影响，因此整体用 NumPy 掩码一次完成。
+
+    参数:
+        bins_min, bins_max: 子容器最小/最大点 (M, 3)
+        ko_min, ko_max: 禁区最小/最大点 (3,)
+
+    返回:
+        切分后的 (min, max) 数组，形状均为 (K, 3)
+    """
+    overlap = np.all((bins_min < ko_max) & (bins_max > ko_min), axis=1)
+    if not np.any(overlap):
+        return bins_min, bins_max
+
+    i_min = np.maximum(bins_min, ko_min)
+    i_max = np.minimum(bins_max, ko_max)
+    a_min, a_max = bins_min, bins_max
+
+    # 六个候选切片 (M, 6, 3)，顺序与 subtract_box 一致：左、右、前、后、底、顶
+    pieces_min = np.empty((bins_min.shape[0], 6, 3))
+    pieces_max = np.empty((bins_min.shape[0], 6, 3))
+
+    pieces_min[:, 0] = a_min
+    pieces_max[:, 0] = np.column_stack((i_min[:, 0], a_max[:, 1], a_max[:, 2]))
+    pieces_min[:, 1] = np.column_stack((i_max[:, 0], a_min[:, 1], a_min[:, 2]))
+    pieces_max[:, 1] = a_max
+
+    pieces_min[:, 2] = np.column_stack((i_min[:, 0], a_min[:, 1], a_min[:, 2]))
+    pieces_max[:, 2] = np.column_stack((i_max[:, 0], i_min[:, 1], a_max[:, 2]))
+    pieces_min[:, 3] = np.column_stack((i_min[:, 0], i_max[:, 1], a_min[:, 2]))
+    pieces_max[:, 3] = np.column_stack((i_max[:, 0], a_max[:, 1], a_max[:, 2]))
+
+    pieces_min[:, 4] = np.column_stack((i_min[:, 0], i_min[:, 1], a_min[:, 2]))
+    pieces_max[:, 4] = np.column_stack((i_max[:, 0], i_max[:, 1], i_min[:, 2]))
+    pieces_min[:, 5] = np.column_stack((i_min[:, 0], i_min[:, 1], i_max[:, 2]))
+    pieces_max[:, 5] = np.column_stack((i_max[:, 0], i_max[:, 1], a_max[:, 2]))
+
+    exists = np.column_stack((
+        a_min[:, 0] < i_min[:, 0], i_max[:, 0] < a_max[:, 0],
+        a_min[:, 1] < i_min[:, 1], i_max[:, 1] < a_max[:, 1],
+        a_min[:, 2] < i_min[:, 2], i_max[:, 2] < a_max[:, 2],
+    ))
+    exists &= np.prod(pieces_max - pieces_min, axis=2) > 1e-6
+
+    # 不重叠的子容器原样保留（占第0槽）
+    keep = ~overlap
+    pieces_min[keep, 0] = a_min[keep]
+    pieces_max[keep, 0] = a_max[keep]
+    exists[keep] = False
+    exists[keep, 0] = True
+
+    return pieces_min[exists], pieces_max[exists]
+
+
 def build_bins(envelope: AABB, keepouts: List[AABB], min_edge_threshold: float = 5.0) -> List[AABB]:
     """
     构建可用子容器列表
 
+    子容器以 (M,3) min/max 数组整体切分，每个禁区对所有子容器一次批量处理。
+
     参数:
         envelope: 舱体AABB
         keepouts: 禁区AABB列表
@@ -103,22 +171,28 @@ def build_bins(envelope: AABB, keepouts: List[AABB], min_edge_threshold: float =
     返回:
         可用子容器AABB列表
     """
-    bins = [envelope]
+    bins_min = np.asarray(envelope.min, dtype=float).reshape(1, 3)
+    bins_max = np.asarray(envelope.max, dtype=float).reshape(1, 3)
 
     # 逐个禁区切分
     for i, ko in enumerate(keepouts):
-        new_bins = []
-        for b in bins:
-            pieces = subtract_box(b, ko)
-            new_bins.extend(pieces)
-        bins = new_bins
-        print(f"  处理禁区 {i+1}/{len(keepouts)}: 当前子容器数 = {len(bins)}")
+        bins_min, bins_max = _subtract_box_batch(
+            bins_min,
+            bins_max,
+            np.asarray(ko.min, dtype=float),
+            np.asarray(ko.max, dtype=float),
+        )
+        logger.debug("处理禁区 %d/%d: 当前子容器数 = %d", i + 1, len(keepouts), len(bins_min))
 
     # 过滤过小的碎片
-    bins_filtered = [b for b in bins if b.min_edge() >= min_edge_threshold]
+    sizes = bins_max - bins_min
+    keep = sizes.min(axis=1) >= min_edge_threshold
+    bins_filtered = [
+        AABB(min=b_min.copy(), max=b_max.copy())
+        for b_min, b_max in zip(bins_min[keep], bins_max[keep])
+    ]
 
-    print(f"切分完成: 总子容器数 = {len(bins)}, 过滤后 = {len(bins_filtered)}")
-    print(f"  子容器总体积: {sum(b.volume() for b in bins_filtered):.0f} mm^3")
+    logger.debug("切分完成: 总子容器数 = %d, 过滤后 = %d", len(bins_min), len(bins_filtered))
 
     return bins_filtered
 
@@ -145,7 +219,8 @@ def build_envelope(cfg: Dict[str, Any], parts: List[Part]) -> EnvelopeGeometry:
 
     if auto:
         # 自动计算外壳尺寸
-        parts_volume = sum(np.prod(p.get_actual_dims()) for p in parts)
+        dims = np.array([p.dims for p in parts], dtype=float).reshape(-1, 3)
+        parts_volume = float(dims.prod(axis=1).sum())
         target_volume = parts_volume / max(fill_ratio, 1e-6)
         base = np.prod(ratio)
         scale = (target_volume / max(base, 1e-6)) ** (1.0 / 3.0)
@@ -173,10 +248,9 @@ def build_envelope(cfg: Dict[str, Any], parts: List[Part]) -> EnvelopeGeometry:
         outer_min = np.array([0.0, 0.0, 0.0])
         outer_max = size
 
-    # 计算内部AABB
-    offset = np.array([thickness, thickness, thickness])
-    inner_min = outer_min + offset
-    inner_max = outer_max - offset
+    # 计算内部AABB（标量厚度直接广播）
+    inner_min = outer_min + thickness
+    inner_max = outer_max - thickness
 
     outer_aabb = AABB(min=outer_min, max=outer_max)
     inner_aabb = AABB(min=inner_min, max=inner_max)
@@ -129,7 +129,11 @@ class LayoutEngine:
         初始化布局引擎
 
         Args:
-            config: 几何配置字典
+            config: 几何配置字典，装箱相关键：
+                - clearance_mm: 部件间隙（mm），默认 5.0
+                - multistart: 多启动次数，默认 3
+                - multistart_jobs: 多启动并行进程数，默认 1（串行）；<=0 表示使用全部 CPU。
+                  子进程以 spawn 方式启动，小规模 BOM 下进程启动开销可能超过收益
         """
         self.config = config
         self.envelope: EnvelopeGeometry = None
@@ -199,7 +203,8 @@ class LayoutEngine:
             parts=self.parts,
             bins=self.bins,
             clearance_mm=self.config.get('clearance_mm', 5.0),
-            multistart=self.config.get('multistart', 3)
+            multistart=self.config.get('multistart', 3),
+            n_jobs=self.config.get('multistart_jobs', 1),
         )
 
         logger.info("\n" + "=" * 60)
@@ -4,27 +4,29 @@
 从layout3dcube迁移
 """
 
+import multiprocessing
+import os
 import random
-from typing import List, Tuple, NamedTuple, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Dict, Optional, Union
 
 import numpy as np
 
+from geometry._aabb_kernels import count_overlaps
 from geometry.schema import AABB, Part, PackingResult
 from py3dbp.constants import RotationType
 RotationType.ALL = [RotationType.RT_WHD]  # 只保留一种朝向，等价于"完全不旋转"
 from py3dbp import Packer, Bin, Item
+from py3dbp.auxiliary_methods import set_to_decimal
+
+# 单面 2D 装箱时 bin 的承重上限（实际不约束）
+_FACE_BIN_MAX_WEIGHT = 99999
 
 
 # ===========================
 # 工具类与辅助数据结构
 # ===========================
 
-class PlacedWithFace(NamedTuple):
-    """内部使用：带有连接面标记的放置结果"""
-    placed: Part
-    face_id: int  # 0~5，见 BinFaceMapper 的约定
-
-
 class BinFaceMapper:
     """
     负责：
@@ -41,6 +43,21 @@ class BinFaceMapper:
     #   4: -Z 面 (z = min_z)，平面 (x,y)
     #   5: +Z 面 (z = max_z)，平面 (x,y)
 
+    # face_id -> (axis_u, axis_v, axis_n)：2D 板的两条边所在轴及法向轴
+    _PROJECTION_AXES: Dict[int, Tuple[int, int, int]] = {
+        0: (1, 2, 0), 1: (1, 2, 0),   # ±X: 平面 (y,z)
+        2: (0, 2, 1), 3: (0, 2, 1),   # ±Y: 平面 (x,z)
+        4: (0, 1, 2), 5: (0, 1, 2),   # ±Z: 平面 (x,y)
+    }
+
+    @staticmethod
+    def _projection_axes(face_id: int) -> Tuple[int, int, int]:
+        """返回 face_id 对应的 (axis_u, axis_v, axis_n)，与 remaining 无关，查表即可。"""
+        try:
+            return BinFaceMapper._PROJECTION_AXES[face_id]
+        except KeyError:
+            raise ValueError(f"未知 face_id: {face_id}") from None
+
     @staticmethod
     def _clone_aabb(aabb: AABB) -> AABB:
         """根据 min/max 克隆一个新的 AABB，避免在原始 bins 上原地修改。"""
@@ -52,21 +69,20 @@ class BinFaceMapper:
     def __init__(self, bin_aabb: AABB) -> None:
         self.original = self._clone_aabb(bin_aabb)
         self.remaining = self._clone_aabb(bin_aabb)
+        self._update_cache()
+
+    def _update_cache(self) -> None:
+        """remaining 更新后缓存其 min/max/size，供热路径直接读取。"""
+        self._rm_min = np.ascontiguousarray(self.remaining.min, dtype=float)
+        self._rm_max = np.ascontiguousarray(self.remaining.max, dtype=float)
+        self._rm_size = self._rm_max - self._rm_min
 
     # ---------- 3D -> 2D: 面板尺寸、part 投影 ----------
 
     def board_size(self, face_id: int) -> Tuple[float, float]:
         """给定 face_id，在当前 remaining 空间下返回 2D 板尺寸 (W, H)。"""
-        size = np.array(self.remaining.size(), dtype=float)  # [dx, dy, dz]
-        dx, dy, dz = size
-        if face_id in (0, 1):      # ±X: 平面 (y,z)
-            return float(dy), float(dz)
-        elif face_id in (2, 3):    # ±Y: 平面 (x,z)
-            return float(dx), float(dz)
-        elif face_id in (4, 5):    # ±Z: 平面 (x,y)
-            return float(dx), float(dy)
-        else:
-            raise ValueError(f"未知 face_id: {face_id}")
+        axis_u, axis_v, _ = self._projection_axes(face_id)
+        return float(self._rm_size[axis_u]), float(self._rm_size[axis_v])
 
     def project_part_dims(self, face_id: int, dims: np.ndarray) -> Tuple[float, float, float]:
         """
@@ -75,15 +91,8 @@ class BinFaceMapper:
           - L_u, L_v：在 2D 板上的 footprint 尺寸；
           - thickness：沿该面法向方向的厚度，用于"切层"。
         """
-        px, py, pz = map(float, dims)
-        if face_id in (4, 5):      # ±Z: 平面 (x,y)，法向为 ±Z，厚度 = pz
-            return px, py, pz
-        elif face_id in (0, 1):    # ±X: 平面 (y,z)，法向为 ±X，厚度 = px
-            return py, pz, px
-        elif face_id in (2, 3):    # ±Y: 平面 (x,z)，法向为 ±Y，厚度 = py
-            return px, pz, py
-        else:
-            raise ValueError(f"未知 face_id: {face_id}")
+        axis_u, axis_v, axis_n = self._projection_axes(face_id)
+        return float(dims[axis_u]), float(dims[axis_v]), float(dims[axis_n])
 
     # ---------- 2D -> 3D: 布局结果反映射 ----------
 
@@ -97,9 +106,8 @@ class BinFaceMapper:
         - 全程使用安装尺寸，不区分正负方向面
         - 返回的是安装坐标（包含间隙），实际坐标由 Part.get_actual_position() 计算
         """
-        rm_min = np.array(self.remaining.min, dtype=float)
-        size = np.array(self.remaining.size(), dtype=float)
-        rm_max = rm_min + size
+        rm_min = self._rm_min
+        rm_max = self._rm_max
         px, py, pz = map(float, install_dims)
 
         if face_id == 0:  # -X, x = rm_min[0]，平面 (y,z)
@@ -142,9 +150,8 @@ class BinFaceMapper:
         if max_thickness <= 0:
             return
 
-        rm_min = np.array(self.remaining.min, dtype=float)
-        size = np.array(self.remaining.size(), dtype=float)
-        rm_max = rm_min + size
+        rm_min = self._rm_min.copy()
+        rm_max = self._rm_max.copy()
 
         if face_id == 4:      # -Z：从下往上切
             rm_min[2] += max_thickness
@@ -165,22 +172,20 @@ class BinFaceMapper:
         new_min = np.minimum(rm_min, rm_max)
         new_max = np.maximum(rm_min, rm_max)
         self.remaining = AABB(min=new_min, max=new_max)
+        self._update_cache()
 
 
 # ===========================
 # 面任务生成 & 单面排布
 # ===========================
 
-def create_face_tasks(bins: List[AABB]) -> List[Tuple[int, int]]:
+def create_face_tasks(bins: List[AABB]) -> np.ndarray:
     """
     面分解函数：
     给定多个 bin，生成所有 (bin_idx, face_id) 组合，face_id ∈ [0,5]。
+    组合编码为整数 task = bin_idx * 6 + face_id，用 divmod(task, 6) 解码。
     """
-    tasks: List[Tuple[int, int]] = []
-    for bin_idx in range(len(bins)):
-        for face_id in range(6):
-            tasks.append((bin_idx, face_id))
-    return tasks
+    return np.arange(6 * len(bins), dtype=np.int32)
 
 
 def pack_single_face(
@@ -188,40 +193,61 @@ def pack_single_face(
     bin_idx: int,
     face_id: int,
     candidate_parts: List[Part],
-) -> Tuple[List[PlacedWithFace], List[Part]]:
+) -> Tuple[List[Part], List[Part], float]:
     """
     单面排布函数：
     - 使用当前 bin 的 BinFaceMapper，在指定 face_id 上做 2D 布局；
     - 按该面上的最大厚度切层更新 mapper.remaining；
-    - 返回本面成功布置的元件（带面标记）和剩余未放置元件。
+    - 返回本面成功布置的元件（mount_face 即 face_id）、剩余未放置元件，以及本面放置的实际体积。
     """
     if not candidate_parts:
-        return [], candidate_parts
+        return [], candidate_parts, 0.0
 
     # 当前剩余空间下，该面的 2D 板尺寸
     W, H = mapper.board_size(face_id)
     if W <= 0 or H <= 0:
         # 剩余空间在这一面已经为 0，无法再布局
-        return [], candidate_parts
-
-    # 建立单面 Packer
-    packer = Packer()
-    packer.add_bin(Bin(f"BIN{bin_idx}_F{face_id}", float(W), float(H), 1.0, max_weight=99999))
+        return [], candidate_parts, 0.0
 
     id2part: Dict[str, Part] = {p.id: p for p in candidate_parts}
-
-    # 为每个候选 Part 添加 2D item（使用安装尺寸）
+    # 每个候选件在该面上的 (安装尺寸, L_u, L_v, 厚度)，装箱前后共用
+    # 投影轴只与 face_id 有关，整面只查一次，逐件直接按轴索引
+    axis_u, axis_v, axis_n = mapper._projection_axes(face_id)
+    dims_cache: Dict[str, Tuple[np.ndarray, float, float, float]] = {}
     for p in candidate_parts:
         install_dims = p.get_install_dims(face_id)
-        L_u, L_v, _ = mapper.project_part_dims(face_id, install_dims)
+        dims_cache[p.id] = (
+            install_dims,
+            float(install_dims[axis_u]),
+            float(install_dims[axis_v]),
+            float(install_dims[axis_n]),
+        )
 
-        # 使用安装尺寸（已经包含了间隙）
-        w = float(L_u)
-        h = float(L_v)
-        d = 1.0
+    # 提前判断：若没有任何候选件能单独放进该面，则跳过 py3dbp 装箱
+    # （按 py3dbp 的 number_of_decimals=0 取整规则比较，保证结果一致）
+    board_w = set_to_decimal(W, 0)
+    board_h = set_to_decimal(H, 0)
+    fits_any = False
+    for p in candidate_parts:
+        _, L_u, L_v, _ = dims_cache[p.id]
+        if (
+            set_to_decimal(L_u, 0) <= board_w
+            and set_to_decimal(L_v, 0) <= board_h
+            and set_to_decimal(p.mass, 0) <= _FACE_BIN_MAX_WEIGHT
+        ):
+            fits_any = True
+            break
+    if not fits_any:
+        return [], candidate_parts, 0.0
+
+    # 建立单面 Packer
+    packer = Packer()
+    packer.add_bin(Bin(f"BIN{bin_idx}_F{face_id}", float(W), float(H), 1.0, max_weight=_FACE_BIN_MAX_WEIGHT))
 
-        item = Item(p.id, w, h, d, p.mass)
-        packer.add_item(item)
+    # 为每个候选 Part 添加 2D item（使用安装尺寸，已经包含了间隙）
+    for p in candidate_parts:
+        _, L_u, L_v, _ = dims_cache[p.id]
+        packer.add_item(Item(p.id, L_u, L_v, 1.0, p.mass))
 
     # 在该面上做一次 2D 装箱
     packer.pack(
@@ -233,24 +259,24 @@ def pack_single_face(
     b = packer.bins[0]
     if not b.items:
         # 这一面一个都放不下
-        return [], candidate_parts
+        return [], candidate_parts, 0.0
 
-    placed_with_face: List[PlacedWithFace] = []
+    placed_face: List[Part] = []
     placed_ids_face = set()
     max_thickness = 0.0
+    placed_volume = 0.0
 
     for it in b.items:
         pid = it.name
         original_part = id2part[pid]
-        install_dims = original_part.get_install_dims(face_id)
+        install_dims, _, _, thickness = dims_cache[pid]
 
         # 映射 (u,v) -> 3D 安装坐标（使用安装尺寸）
         u = float(it.position[0])
         v = float(it.position[1])
         install_pos = mapper.uv_to_world_min(face_id, u, v, install_dims)
 
-        # 计算当前 part 在该面的厚度（用于切层，使用安装尺寸）
-        _, _, thickness = mapper.project_part_dims(face_id, install_dims)
+        # 当前 part 在该面的厚度（用于切层，使用安装尺寸）
         max_thickness = max(max_thickness, thickness)
 
         # 计算安装位点（使用安装坐标和安装尺寸）
@@ -272,8 +298,10 @@ def pack_single_face(
             mount_point=mount_point
         )
 
-        placed_with_face.append(PlacedWithFace(placed=placed_part, face_id=face_id))
+        placed_face.append(placed_part)
         placed_ids_face.add(original_part.id)
+        dx, dy, dz = original_part.dims
+        placed_volume += float(dx) * float(dy) * float(dz)
 
     # 按当前面最大厚度沿法向切掉一层空间
     mapper.cut_after_face(face_id, max_thickness)
@@ -281,59 +309,42 @@ def pack_single_face(
     # 更新剩余未放置元件
     remaining_parts = [p for p in candidate_parts if p.id not in placed_ids_face]
 
-    return placed_with_face, remaining_parts
+    return placed_face, remaining_parts, placed_volume
 
 
 # ===========================
 # 重合度计算
 # ===========================
 
-def compute_overlap_count(placed_with_face_list: List[PlacedWithFace]) -> int:
+def compute_overlap_count(parts: List[Part]) -> int:
     """
     计算 3D 重合次数：
     - 面内默认不重合（依赖 py3dbp 的 2D 排布），不再检查；
-    - 对不同 face_id 但同一 bin 的元件，两两检查 3D AABB 是否有体积交集；
+    - 对不同 mount_face 但同一 bin 的元件，两两检查 3D AABB 是否有体积交集；
     - 使用实际坐标和实际尺寸进行碰撞检测；
     - 返回发生重合的 pair 数目。
+
+    实现上先一次性构建 SoA 数组（mins/maxs/faces/bins），再交给 count_overlaps 内核计算。
+    实际最小角偏移直接取自 Part 的按面查找表，与 Part.get_actual_position 共用同一规则。
     """
-    overlaps = 0
-    eps = 1e-6
-    n = len(placed_with_face_list)
-
-    for i in range(n):
-        a = placed_with_face_list[i]
-        part_a = a.placed
-        # 使用实际坐标和实际尺寸
-        pos_a = part_a.get_actual_position()
-        dims_a = part_a.get_actual_dims()
-        min_a = pos_a
-        max_a = pos_a + dims_a
-
-        for j in range(i + 1, n):
-            b = placed_with_face_list[j]
-
-            # 不同面、且在同一个 bin 上才需要检查
-            if a.face_id == b.face_id:
-                continue
-            if part_a.bin_index != b.placed.bin_index:
-                continue
-
-            part_b = b.placed
-            # 使用实际坐标和实际尺寸
-            pos_b = part_b.get_actual_position()
-            dims_b = part_b.get_actual_dims()
-            min_b = pos_b
-            max_b = pos_b + dims_b
-
-            # 3D AABB 相交条件（严格体积交集，接触不算重合）
-            overlap_x = (min_a[0] < max_b[0] - eps) and (min_b[0] < max_a[0] - eps)
-            overlap_y = (min_a[1] < max_b[1] - eps) and (min_b[1] < max_a[1] - eps)
-            overlap_z = (min_a[2] < max_b[2] - eps) and (min_b[2] < max_a[2] - eps)
-
-            if overlap_x and overlap_y and overlap_z:
-                overlaps += 1
-
-    return overlaps
+    n = len(parts)
+    if n < 2:
+        return 0
+
+    for part in parts:
+        if part.position is None or part.mount_face is None:
+            raise ValueError(f"Part {part.id} 未放置，无法计算实际坐标")
+
+    positions = np.array([part.position for part in parts], dtype=float)
+    dims = np.stack([part._dims_array() for part in parts])
+    offsets = np.stack([part._actual_offset_table()[part.mount_face] for part in parts])
+
+    mins = positions + offsets
+    maxs = mins + dims
+    faces = np.fromiter((part.mount_face for part in parts), dtype=np.int8, count=n)
+    bins = np.fromiter((part.bin_index for part in parts), dtype=np.int32, count=n)
+
+    return count_overlaps(mins, maxs, faces, bins, eps=1e-6)
 
 
 # ===========================
@@ -344,35 +355,38 @@ def _single_run_pack(
     parts: List[Part],
     bins: List[AABB],
     clearance_mm: float,
-) -> Tuple[List[Part], List[Part], Dict[str, float]]:
+    rng: np.random.Generator,
+) -> Tuple[List[Part], List[Part], Dict[str, Union[int, float]]]:
     """
-    单次运行：
+    单次运行（随机性全部来自传入的 rng）：
     - 为每个 bin 构造一个 BinFaceMapper（管理剩余空间和 3D<->2D 映射）；
     - 生成所有 (bin,face) 面任务，随机顺序逐个执行；
     - 每完成一个面的布局，用该面的最大厚度切掉一层空间；
-    - 记录所有放置结果（带 face_id）；
+    - 记录所有放置结果（连接面记录在 Part.mount_face）；
     - 计算重合次数、已放件数、体积和使用 bin 数。
     """
     # 拷贝一份元件列表并打乱
-    remaining_parts: List[Part] = parts.copy()
-    random.shuffle(remaining_parts)
+    remaining_parts: List[Part] = [parts[i] for i in rng.permutation(len(parts))]
 
     # 为每个 bin 创建独立的 face mapper（带独立 remaining AABB）
     mappers: List[BinFaceMapper] = [BinFaceMapper(b) for b in bins]
 
     # 生成面任务，并随机顺序
     face_tasks = create_face_tasks(bins)
-    random.shuffle(face_tasks)
+    rng.shuffle(face_tasks)
 
-    placed_with_face_all: List[PlacedWithFace] = []
+    placed_parts_run: List[Part] = []
     used_bins = set()
+    placed_volume = 0.0
 
-    for (bin_idx, face_id) in face_tasks:
+    for task in face_tasks:
         if not remaining_parts:
             break
 
+        bin_idx, face_id = divmod(int(task), 6)
+
         mapper = mappers[bin_idx]
-        placed_face, remaining_parts = pack_single_face(
+        placed_face, remaining_parts, face_volume = pack_single_face(
             mapper=mapper,
             bin_idx=bin_idx,
             face_id=face_id,
@@ -381,26 +395,55 @@ def _single_run_pack(
 
         if placed_face:
             used_bins.add(bin_idx)
-            placed_with_face_all.extend(placed_face)
+            placed_parts_run.extend(placed_face)
+            placed_volume += face_volume
 
-    placed_parts: List[Part] = [pwf.placed for pwf in placed_with_face_all]
+    placed_parts: List[Part] = placed_parts_run
     unplaced_parts: List[Part] = remaining_parts
 
     placed_count = len(placed_parts)
-    placed_volume = float(sum(np.prod(pp.get_actual_dims()) for pp in placed_parts)) if placed_parts else 0.0
     used_bin_count = len(used_bins)
-    overlap_count = compute_overlap_count(placed_with_face_all)
+    overlap_count = compute_overlap_count(placed_parts)
 
     stats = {
         "overlap_count": overlap_count,
-        "placed_count": float(placed_count),
+        "placed_count": placed_count,
         "placed_volume": placed_volume,
-        "used_bins": float(used_bin_count),
+        "used_bins": used_bin_count,
     }
 
     return placed_parts, unplaced_parts, stats
 
 
+def _single_run_pack_seeded(
+    parts: List[Part],
+    bins: List[AABB],
+    clearance_mm: float,
+    seed: int,
+) -> Tuple[List[Part], List[Part], Dict[str, Union[int, float]]]:
+    """以独立种子执行一次 _single_run_pack（可在子进程中调用）。"""
+    return _single_run_pack(parts, bins, clearance_mm, np.random.default_rng(seed))
+
+
+# 子进程内的只读共享输入，由 _init_worker 在进程启动时写入一次
+_WORKER_PARTS: List[Part] = []
+_WORKER_BINS: List[AABB] = []
+_WORKER_CLEARANCE_MM: float = 0.0
+
+
+def _init_worker(parts: List[Part], bins: List[AABB], clearance_mm: float) -> None:
+    """进程池 initializer：每个子进程只接收一次 parts/bins，之后的任务只传种子。"""
+    global _WORKER_PARTS, _WORKER_BINS, _WORKER_CLEARANCE_MM
+    _WORKER_PARTS = parts
+    _WORKER_BINS = bins
+    _WORKER_CLEARANCE_MM = clearance_mm
+
+
+def _run_with_seed(seed: int) -> Tuple[List[Part], List[Part], Dict[str, Union[int, float]]]:
+    """子进程任务：使用 _init_worker 写入的共享输入执行一次启动。"""
+    return _single_run_pack_seeded(_WORKER_PARTS, _WORKER_BINS, _WORKER_CLEARANCE_MM, seed)
+
+
 # ===========================
 # 多次运行：对外主接口
 # ===========================
@@ -409,7 +452,8 @@ def multistart_pack(
     parts: List[Part],
     bins: List[AABB],
     clearance_mm: float = 5.0,
-    multistart: int = 3
+    multistart: int = 3,
+    n_jobs: int = 1,
 ) -> PackingResult:
     """
     多启动装箱（多面贴壁 + 切层 + 重合度优先评分版）
@@ -425,6 +469,8 @@ def multistart_pack(
         bins: 可用子容器列表
         clearance_mm: 间隙（mm）
         multistart: 多启动次数
+        n_jobs: 并行进程数（1 为串行；<=0 表示使用全部 CPU）。
+            每次启动的种子预先从全局 random 抽取，结果与并行度无关。
 
     Returns:
         PackingResult对象
@@ -447,17 +493,31 @@ def multistart_pack(
 
     best_placed_global: List[Part] = []
     best_unplaced_global: List[Part] = parts
-    # score = (-overlap_count, placed_count, placed_volume, -used_bins)
-    best_score: Tuple[float, float, float, float] = (
-        float("-inf"),  # -overlap_count
-        -1.0,           # placed_count
-        0.0,            # placed_volume
-        float("-inf"),  # -used_bins
-    )
-
-    for run in range(multistart):
+    # score = (-overlap_count, placed_count, placed_volume, -used_bins)，首个启动直接作为初值
+    best_score: Optional[Tuple[int, int, float, int]] = None
+
+    # 各次启动相互独立：预先抽取种子，串行与并行得到相同结果
+    seeds = [random.randrange(2 ** 32) for _ in range(multistart)]
+    max_workers = min(n_jobs if n_jobs > 0 else (os.cpu_count() or 1), multistart)
+
+    if max_workers > 1:
+        # 使用 spawn：父进程若已启动 numba parallel 线程池（TBB/OpenMP），fork 出的子进程会死锁。
+        # parts/bins 通过 initializer 每个子进程只序列化一次，任务本身只传种子
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(parts, bins, clearance_mm),
+        ) as executor:
+            run_results = list(executor.map(_run_with_seed, seeds))
+    else:
+        run_results = [
+            _single_run_pack_seeded(parts, bins, clearance_mm, seed)
+            for seed in seeds
+        ]
+
+    for run, (placed_run, unplaced_run, stats) in enumerate(run_results):
         print(f"\n  === 启动 {run + 1}/{multistart} ===")
-        placed_run, unplaced_run, stats = _single_run_pack(parts, bins, clearance_mm)
 
         overlap_count = stats["overlap_count"]
         placed_count = stats["placed_count"]
@@ -473,19 +533,20 @@ def multistart_pack(
 
         print(
             f"    结果: 重合对数={overlap_count}, "
-            f"放置 {int(placed_count)}/{len(parts)} 件, "
-            f"体积 {placed_volume:.0f}, 使用 {int(used_bins)} 个容器"
+            f"放置 {placed_count}/{len(parts)} 件, "
+            f"体积 {placed_volume:.0f}, 使用 {used_bins} 个容器"
         )
 
-        if score > best_score:
+        if best_score is None or score > best_score:
             best_score = score
             best_placed_global = placed_run
             best_unplaced_global = unplaced_run
 
+    best_overlap, best_placed_count, best_volume, best_neg_bins = best_score
     print(
-        f"\n最优结果: 重合对数={int(-best_score[0])}, "
-        f"放置 {int(best_score[1])}/{len(parts)} 件, "
-        f"体积 {best_score[2]:.0f}, 使用 {int(-best_score[3])} 个容器"
+        f"\n最优结果: 重合对数={-best_overlap}, "
+        f"放置 {best_placed_count}/{len(parts)} 件, "
+        f"体积 {best_volume:.0f}, 使用 {-best_neg_bins} 个容器"
     )
     print(
         f"装箱完成(多面贴壁布局+切层): 已放置 {len(best_placed_global)} 件, "
@@ -495,8 +556,8 @@ def multistart_pack(
     return PackingResult(
         placed=best_placed_global,
         unplaced=best_unplaced_global,
-        bins_used=int(-best_score[3]),
-        total_volume=best_score[2],
-        overlap_count=int(-best_score[0]),
-        score=(int(-best_score[0]), int(best_score[1]), best_score[2], int(-best_score[3]))
+        bins_used=-best_neg_bins,
+        total_volume=best_volume,
+        overlap_count=-best_overlap,
+        score=(-best_overlap, best_placed_count, best_volume, -best_neg_bins)
     )
@@ -4,12 +4,12 @@
 从layout3dcube迁移并适配统一协议
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, Optional, List
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class AABB:
     """轴对齐包围盒 (Axis-Aligned Bounding Box)"""
     min: np.ndarray  # [x, y, z] 最小点
@@ -23,14 +23,14 @@ class AABB:
             self.max = np.array(self.max, dtype=float)
 
     def volume(self) -> float:
-        """计算体积"""
-        size = self.max - self.min
-        return float(np.prod(size))
+        """计算体积（逐轴标量运算，避免临时数组）"""
+        a_min, a_max = self.min, self.max
+        return float(a_max[0] - a_min[0]) * float(a_max[1] - a_min[1]) * float(a_max[2] - a_min[2])
 
     def min_edge(self) -> float:
-        """获取最小边长"""
-        size = self.max - self.min
-        return float(np.min(size))
+        """获取最小边长（逐轴标量运算，避免临时数组）"""
+        a_min, a_max = self.min, self.max
+        return min(float(a_max[0] - a_min[0]), float(a_max[1] - a_min[1]), float(a_max[2] - a_min[2]))
 
     def center(self) -> np.ndarray:
         """获取中心点"""
@@ -45,11 +45,17 @@ class AABB:
         return AABB(min=self.min.copy(), max=self.max.copy())
 
     def intersects(self, other: 'AABB') -> bool:
-        """检查是否与另一个AABB相交"""
-        return np.all(self.min < other.max) and np.all(other.min < self.max)
+        """检查是否与另一个AABB相交（逐轴标量比较，避免临时数组）"""
+        a_min, a_max = self.min, self.max
+        b_min, b_max = other.min, other.max
+        return bool(
+            a_min[0] < b_max[0] and b_min[0] < a_max[0]
+            and a_min[1] < b_max[1] and b_min[1] < a_max[1]
+            and a_min[2] < b_max[2] and b_min[2] < a_max[2]
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     """
     设备件（合并了原Part和PlacedPart）
@@ -68,6 +74,14 @@ class Part:
     mount_face: Optional[int] = None  # 安装面（0~5，None表示未放置）
     mount_point: Optional[np.ndarray] = None  # 安装位点（安装面中点）
 
+    # dims/clearance_mm 派生数组的惰性缓存，连同构建时的输入一起保存，
+    # 访问时比对输入，字段被重新赋值后自动重建
+    _dims_arr: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _dims_src: Optional[Tuple[float, float, float]] = field(default=None, init=False, repr=False, compare=False)
+    _install_clearance: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _actual_offset: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _clearance_src: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """确保数组类型正确"""
         if self.position is not None and not isinstance(self.position, np.ndarray):
@@ -75,9 +89,57 @@ class Part:
         if self.mount_point is not None and not isinstance(self.mount_point, np.ndarray):
             self.mount_point = np.array(self.mount_point, dtype=float)
 
+    def _dims_array(self) -> np.ndarray:
+        """内部使用：返回缓存的只读尺寸数组（dims 被重新赋值后重建）"""
+        if self._dims_arr is None or self.dims is not self._dims_src:
+            dims_arr = np.array(self.dims, dtype=np.float64)
+            dims_arr.setflags(write=False)
+            self._dims_arr = dims_arr
+            self._dims_src = self.dims
+        return self._dims_arr
+
+    def _build_face_tables(self) -> None:
+        """
+        按安装面（0~5）构建两张 (6,3) 只读查找表：
+        - _install_clearance：安装尺寸相对实际尺寸的间隙
+        - _actual_offset：实际最小角相对安装坐标的偏移
+        """
+        half_clearance = self.clearance_mm / 2.0
+        full_clearance = float(self.clearance_mm)
+
+        install_clearance = np.full((6, 3), full_clearance)
+        actual_offset = np.full((6, 3), full_clearance)
+        for face_id in range(6):
+            mount_axis = face_id // 2
+            install_clearance[face_id, mount_axis] = half_clearance
+            # 负方向面直接贴墙不偏移，正方向面偏移半个间隙
+            actual_offset[face_id, mount_axis] = 0.0 if face_id % 2 == 0 else half_clearance
+
+        install_clearance.setflags(write=False)
+        actual_offset.setflags(write=False)
+        self._install_clearance = install_clearance
+        self._actual_offset = actual_offset
+        self._clearance_src = self.clearance_mm
+
+    def _face_tables_stale(self) -> bool:
+        """查找表尚未构建，或 clearance_mm 已不同于构建时的取值"""
+        return self._install_clearance is None or self.clearance_mm != self._clearance_src
+
+    def _install_clearance_table(self) -> np.ndarray:
+        """内部使用：返回 (6,3) 安装间隙查找表"""
+        if self._face_tables_stale():
+            self._build_face_tables()
+        return self._install_clearance
+
+    def _actual_offset_table(self) -> np.ndarray:
+        """内部使用：返回 (6,3) 实际最小角偏移查找表"""
+        if self._face_tables_stale():
+            self._build_face_tables()
+        return self._actual_offset
+
     def get_actual_dims(self) -> np.ndarray:
         """返回实际尺寸"""
-        return np.array(self.dims, dtype=float)
+        return self._dims_array().copy()
 
     def get_install_dims(self, face_id: int) -> np.ndarray:
         """
@@ -90,18 +152,7 @@ class Part:
         安装面约定：
         0: -X面, 1: +X面, 2: -Y面, 3: +Y面, 4: -Z面, 5: +Z面
         """
-        actual_dims = np.array(self.dims, dtype=float)
-        half_clearance = self.clearance_mm / 2.0
-        full_clearance = self.clearance_mm
-
-        # 安装面对应的轴索引：0,1->X轴(0), 2,3->Y轴(1), 4,5->Z轴(2)
-        mount_axis = face_id // 2
-
-        # 创建间隙数组：安装面方向+半个间隙，其他方向+完整间隙
-        clearance_array = np.full(3, full_clearance)
-        clearance_array[mount_axis] = half_clearance
-
-        return actual_dims + clearance_array
+        return self._dims_array() + self._install_clearance_table()[face_id]
 
     def get_actual_position(self) -> np.ndarray:
         """
@@ -119,28 +170,8 @@ class Part:
         if self.position is None or self.mount_face is None:
             raise ValueError(f"Part {self.id} 未放置，无法计算实际坐标")
 
-        install_pos = np.array(self.position, dtype=float)
-        half_clearance = self.clearance_mm / 2.0
-        full_clearance = self.clearance_mm
-
-        # 安装面对应的轴索引
-        mount_axis = self.mount_face // 2
-        is_negative_face = (self.mount_face % 2 == 0)  # 负方向面
-
-        # 创建偏移量数组
-        offset = np.full(3, full_clearance)  # 默认所有方向都加完整间隙
-
-        if is_negative_face:
-            # 负方向面：安装面方向不加偏移（直接贴墙）
-            offset[mount_axis] = 0.0
-        else:
-            # 正方向面：安装面方向加半个间隙
-            offset[mount_axis] = half_clearance
-
         # 实际坐标 = 安装坐标 + 偏移量
-        actual_pos = install_pos + offset
-
-        return actual_pos
+        return np.asarray(self.position, dtype=float) + self._actual_offset_table()[self.mount_face]
 
     def compute_mount_point(self, face_id: int, position: np.ndarray) -> np.ndarray:
         """
@@ -154,7 +185,7 @@ class Part:
             安装位点坐标 [x, y, z]
         """
         pos = np.array(position, dtype=float)
-        dims = np.array(self.dims, dtype=float)
+        dims = self._dims_array()
 
         # 安装面对应的轴索引和方向
         mount_axis = face_id // 2
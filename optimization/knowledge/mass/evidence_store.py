@@ -100,6 +100,7 @@ class MassEvidenceStore:
         self.evidence_file = self.base_path / "mass_evidence.jsonl"
         self.logger = logger
         self._items: List[MassEvidence] = []
+        self._fingerprints: Dict[str, int] = {}
         self.reload()
 
     def reload(self) -> None:
@@ -132,14 +133,31 @@ class MassEvidenceStore:
             return
 
         self._items = loaded
+        self._rebuild_fingerprints()
 
     def save(self) -> None:
+        self._rebuild_fingerprints()
         lines = [json.dumps(item.to_dict(), ensure_ascii=False) for item in self._items]
         content = "\n".join(lines).strip()
         if content:
             content += "\n"
         self.evidence_file.write_text(content, encoding="utf-8")
 
+    def _append(self, evidence: MassEvidence) -> None:
+        line = json.dumps(evidence.to_dict(), ensure_ascii=False) + "\n"
+        with self.evidence_file.open("a+b") as handle:
+            handle.seek(0, 2)
+            if handle.tell() > 0:
+                handle.seek(-1, 2)
+                if handle.read(1) != b"\n":
+                    line = "\n" + line
+            handle.write(line.encode("utf-8"))
+
+    def _rebuild_fingerprints(self) -> None:
+        self._fingerprints = {}
+        for index, item in enumerate(self._items):
+            self._fingerprints.setdefault(self._fingerprint(item), index)
+
     def list(self) -> List[MassEvidence]:
         return [item.copy() for item in list(self._items or [])]
 
@@ -155,14 +173,15 @@ class MassEvidenceStore:
         if not evidence.evidence_id:
             evidence.evidence_id = self._next_id()
 
+        fp = self._fingerprint(evidence)
         if deduplicate:
-            fp = self._fingerprint(evidence)
-            for item in self._items:
-                if self._fingerprint(item) == fp:
-                    return item.copy()
+            existing_index = self._fingerprints.get(fp)
+            if existing_index is not None:
+                return self._items[existing_index].copy()
 
         self._items.append(evidence.copy())
-        self.save()
+        self._fingerprints.setdefault(fp, len(self._items) - 1)
+        self._append(evidence)
         return evidence.copy()
 
     def add_many(self, evidence_items: Iterable[MassEvidence], *, deduplicate: bool = True) -> int:
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import hashlib
-import math
 import re
-from typing import Dict, Iterable, List, Set
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 
@@ -34,6 +34,10 @@ def _hash_feature_vector(text: str, *, dim: int = 512) -> np.ndarray:
     return vec
 
 
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(str(text or "").encode("utf-8"), digest_size=16).digest()
+
+
 def _context_violations(context: GlobalContextPack) -> Set[str]:
     return {str(v.violation_type).strip().lower() for v in list(context.violations or [])}
 
@@ -132,8 +136,51 @@ class SymbolicRetriever:
 class SemanticRetriever:
     """Feature-hashing semantic retriever (local, no external API dependency)."""
 
-    def __init__(self, *, dim: int = 512) -> None:
+    def __init__(self, *, dim: int = 512, query_cache_size: int = 512) -> None:
         self.dim = max(int(dim), 64)
+        self.query_cache_size = max(int(query_cache_size), 0)
+        self._query_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._evidence_vectors: Dict[bytes, np.ndarray] = {}
+        self._evidence_keys: Tuple[bytes, ...] = ()
+        self._evidence_matrix: Optional[np.ndarray] = None
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        if self.query_cache_size <= 0:
+            return _hash_feature_vector(text, dim=self.dim)
+        key = _text_key(text)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        vec = _hash_feature_vector(text, dim=self.dim)
+        vec.setflags(write=False)
+        self._query_cache[key] = vec
+        if len(self._query_cache) > self.query_cache_size:
+            self._query_cache.popitem(last=False)
+        return vec
+
+    def _evidence_matrix_for(self, evidence_list: List[MassEvidence]) -> np.ndarray:
+        texts = [item.as_retrieval_text() for item in evidence_list]
+        keys = tuple(_text_key(text) for text in texts)
+        if self._evidence_matrix is not None and keys == self._evidence_keys:
+            return self._evidence_matrix
+
+        previous = self._evidence_vectors
+        vectors: Dict[bytes, np.ndarray] = {}
+        for key, text in zip(keys, texts):
+            if key in vectors:
+                continue
+            vec = previous.get(key)
+            if vec is None:
+                vec = _hash_feature_vector(text, dim=self.dim)
+            vectors[key] = vec
+
+        matrix = np.vstack([vectors[key] for key in keys])
+        matrix.setflags(write=False)
+        self._evidence_vectors = vectors
+        self._evidence_keys = keys
+        self._evidence_matrix = matrix
+        return matrix
 
     def retrieve(
         self,
@@ -148,33 +195,35 @@ class SemanticRetriever:
             return []
 
         query_text = self._build_query_text(context=context, phase=phase)
-        query_vec = _hash_feature_vector(query_text, dim=self.dim)
+        query_vec = self._query_vector(query_text)
         query_norm = float(np.linalg.norm(query_vec))
         if query_norm <= 0.0:
             return []
 
-        matrix = np.vstack(
-            [_hash_feature_vector(item.as_retrieval_text(), dim=self.dim) for item in evidence_list]
-        )
-        similarities = np.matmul(matrix, query_vec.reshape(-1, 1)).reshape(-1)
+        matrix = self._evidence_matrix_for(evidence_list)
+        similarities = matrix @ query_vec
 
-        candidates: List[RetrievalCandidate] = []
-        for idx, similarity in enumerate(similarities):
-            sim_value = float(similarity)
-            if not math.isfinite(sim_value):
-                continue
-            if sim_value <= 0.0:
-                continue
-            candidates.append(
-                RetrievalCandidate(
-                    evidence=evidence_list[idx].copy(),
-                    score=sim_value,
-                    channels=["semantic"],
-                )
+        limit = max(int(top_k), 0)
+        valid = np.flatnonzero(np.isfinite(similarities) & (similarities > 0.0))
+        if limit == 0 or valid.size == 0:
+            return []
+        values = similarities[valid]
+        if valid.size > limit:
+            # Ties at the k-th value keep index order, matching a stable sort.
+            kth_value = -np.partition(-values, limit - 1)[limit - 1]
+            keep = np.flatnonzero(values >= kth_value)
+        else:
+            keep = np.arange(valid.size)
+        order = keep[np.lexsort((keep, -values[keep]))][:limit]
+
+        return [
+            RetrievalCandidate(
+                evidence=evidence_list[int(valid[idx])].copy(),
+                score=float(values[idx]),
+                channels=["semantic"],
             )
-
-        candidates.sort(key=lambda item: item.score, reverse=True)
-        return candidates[: max(int(top_k), 0)]
+            for idx in order
+        ]
 
     def _build_query_text(self, *, context: GlobalContextPack, phase: str) -> str:
         parts: List[str] = [f"phase:{str(phase or 'A').strip().upper()}"]
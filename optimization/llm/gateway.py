@@ -11,7 +11,6 @@ from dataclasses import dataclass, field
 from http import HTTPStatus
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import dashscope
 import requests
 from openai import (
     APIConnectionError,
@@ -23,7 +22,7 @@ from openai import (
 )
 
 from core.exceptions import ConfigurationError, LLMError
-from optimization.llm.runtime_client import extract_json_object_text, mask_secret
+from optimization.llm.runtime_client import extract_json_object_text, get_http_session, mask_secret
 
 
 DEFAULT_TEXT_PROFILE = "qwen_max_default"
@@ -32,6 +31,7 @@ DEFAULT_TIMEOUT_S = 120.0
 ENV_PLACEHOLDER_PATTERN = re.compile(r"^\$\{([A-Za-z_][A-Za-z0-9_]*)\}$")
 DEFAULT_REASONING_PROFILE = "balanced"
 DEFAULT_THINKING_MODE = "auto"
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
 
 
 @dataclass
@@ -84,6 +84,7 @@ class LLMCallResult:
     strict_json_thinking_mode: str = ""
     completion_budget_tokens: int = 0
     reasoning_budget_tokens: int = 0
+    cached_tokens: int = 0
     request_payload: Dict[str, Any] = field(default_factory=dict)
     response_payload: Any = None
 
@@ -102,6 +103,7 @@ class LLMCallResult:
             "strict_json_thinking_mode": str(self.strict_json_thinking_mode or ""),
             "completion_budget_tokens": int(self.completion_budget_tokens or 0),
             "reasoning_budget_tokens": int(self.reasoning_budget_tokens or 0),
+            "cached_tokens": int(self.cached_tokens or 0),
         }
 
 
@@ -118,6 +120,40 @@ class LLMEmbeddingResult:
     response_payload: Any = None
 
 
+def _prompt_cache_enabled(profile: LLMProviderProfile) -> bool:
+    return bool((profile.provider_options or {}).get("prompt_cache", False))
+
+
+def _apply_prompt_cache(messages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Mark system messages as cacheable prefixes (explicit context cache)."""
+    marked: List[Dict[str, Any]] = []
+    for message in list(messages or []):
+        content = message.get("content")
+        if str(message.get("role", "") or "").strip().lower() == "system" and isinstance(content, str):
+            message = dict(message)
+            message["content"] = [
+                {"type": "text", "text": content, "cache_control": dict(PROMPT_CACHE_CONTROL)}
+            ]
+        marked.append(message)
+    return marked
+
+
+def _extract_cached_tokens(response: Any) -> int:
+    usage = response.get("usage") if isinstance(response, dict) else getattr(response, "usage", None)
+    if usage is None:
+        return 0
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(
+        usage, "prompt_tokens_details", None
+    )
+    if details is None:
+        return 0
+    cached = details.get("cached_tokens") if isinstance(details, dict) else getattr(details, "cached_tokens", 0)
+    try:
+        return max(int(cached or 0), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
 class LLMProfileResolver:
     def __init__(self, openai_config: Optional[Dict[str, Any]] = None):
         self.openai_config = dict(openai_config or {})
@@ -436,6 +472,22 @@ class LLMProfileResolver:
 
 
 class OpenAICompatibleAdapter:
+    def __init__(self) -> None:
+        self._clients: Dict[Tuple[str, str, float], OpenAI] = {}
+
+    def _client_for(self, profile: LLMProviderProfile) -> OpenAI:
+        # 复用同一 (key, base_url, timeout) 的客户端，保留其 HTTP 连接池
+        key = (profile.api_key, profile.base_url or "", float(profile.timeout_s))
+        client = self._clients.get(key)
+        if client is None:
+            client = OpenAI(
+                api_key=profile.api_key,
+                base_url=profile.base_url or None,
+                timeout=profile.timeout_s,
+            )
+            self._clients[key] = client
+        return client
+
     def generate_text(
         self,
         profile: LLMProviderProfile,
@@ -449,11 +501,7 @@ class OpenAICompatibleAdapter:
         thinking_mode: str = "",
         reasoning_budget_tokens: Optional[int] = None,
     ) -> LLMCallResult:
-        client = OpenAI(
-            api_key=profile.api_key,
-            base_url=profile.base_url or None,
-            timeout=profile.timeout_s,
-        )
+        client = self._client_for(profile)
         resolved_reasoning_profile = self._resolve_reasoning_profile(
             profile.reasoning_profile,
             reasoning_profile,
@@ -475,7 +523,7 @@ class OpenAICompatibleAdapter:
         )
         request_payload: Dict[str, Any] = {
             "model": profile.model,
-            "messages": list(messages or []),
+            "messages": _apply_prompt_cache(messages) if _prompt_cache_enabled(profile) else list(messages or []),
             "temperature": float(profile.temperature if temperature is None else temperature),
         }
         if resolved_completion_budget > 0:
@@ -532,6 +580,7 @@ class OpenAICompatibleAdapter:
             strict_json_thinking_mode=profile.strict_json_thinking_mode,
             completion_budget_tokens=resolved_completion_budget,
             reasoning_budget_tokens=resolved_reasoning_budget,
+            cached_tokens=_extract_cached_tokens(response),
             request_payload=request_payload,
             response_payload=response_payload,
         )
@@ -631,11 +680,7 @@ class OpenAICompatibleAdapter:
         profile: LLMProviderProfile,
         inputs: Iterable[str],
     ) -> LLMEmbeddingResult:
-        client = OpenAI(
-            api_key=profile.api_key,
-            base_url=profile.base_url or None,
-            timeout=profile.timeout_s,
-        )
+        client = self._client_for(profile)
         request_payload: Dict[str, Any] = {
             "model": profile.model,
             "input": list(inputs or []),
@@ -749,7 +794,7 @@ class OpenAIResponsesAdapter:
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 self._resolve_responses_url(profile),
                 headers=headers,
                 json=request_payload,
@@ -926,10 +971,12 @@ class DashScopeNativeAdapter:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
     ) -> LLMCallResult:
+        import dashscope  # 延迟导入：SDK 较重，仅在走 DashScope 原生接口时加载
+
         dashscope.api_key = profile.api_key
         request_payload: Dict[str, Any] = {
             "model": profile.model,
-            "messages": list(messages or []),
+            "messages": _apply_prompt_cache(messages) if _prompt_cache_enabled(profile) else list(messages or []),
             "result_format": "message",
             "temperature": float(profile.temperature if temperature is None else temperature),
         }
@@ -954,6 +1001,7 @@ class DashScopeNativeAdapter:
             api_style="dashscope_generation",
             key_source=profile.api_key_source,
             key_source_masked=profile.key_source_masked,
+            cached_tokens=_extract_cached_tokens(response),
             request_payload=request_payload,
             response_payload=response,
         )
@@ -11,8 +11,8 @@ from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
-import dashscope
 import requests
+from requests.adapters import HTTPAdapter
 
 from core.exceptions import LLMError
 
@@ -21,6 +21,20 @@ DEFAULT_LLM_MODEL = "qwen3-max"
 DEFAULT_LLM_API_MODE = "dashscope_generation"
 DEFAULT_LLM_TIMEOUT_S = 120.0
 
+_HTTP_SESSION: requests.Session | None = None
+
+
+def get_http_session() -> requests.Session:
+    """Process-wide keep-alive session for direct HTTP LLM endpoints."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
 
 def extract_json_object_text(raw_text: str) -> str:
     text = str(raw_text or "").strip()
@@ -159,6 +173,8 @@ class RuntimeLLMClient:
         self.timeout_s = max(float(timeout_s), 1.0)
 
         if self.api_mode == "dashscope_generation":
+            import dashscope  # 延迟导入：SDK 较重，仅在 dashscope_generation 模式下加载
+
             dashscope.api_key = self.api_key
 
     def generate_text(self, messages: List[Dict[str, Any]]) -> LLMCallResult:
@@ -169,6 +185,8 @@ class RuntimeLLMClient:
         raise LLMError(f"Unsupported LLM api_mode: {self.api_mode}")
 
     def _call_dashscope_generation(self, messages: List[Dict[str, Any]]) -> LLMCallResult:
+        import dashscope
+
         request_payload = {
             "model": self.model,
             "messages": messages,
@@ -207,7 +225,7 @@ class RuntimeLLMClient:
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 url,
                 headers=headers,
                 json=request_payload,
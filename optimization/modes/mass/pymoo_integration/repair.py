@@ -4,7 +4,6 @@ Custom repair operator for mild overlap removal.
 
 from __future__ import annotations
 
-import traceback
 from typing import Optional
 
 import numpy as np
@@ -176,7 +175,6 @@ class CentroidPushApartRepair(Repair):
 
             except Exception:
                 # Preserve original candidate and continue robustly.
-                _ = traceback.format_exc()
                 candidate = self.codec.clip(repaired[idx, :])
 
             repaired[idx, :] = self.codec.clip(candidate)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from core.exceptions import GeometryError
+from geometry.ffd import FFDDeformer
+
+
+def _reference_world_points(deformer: FFDDeformer, parametric: np.ndarray) -> np.ndarray:
+    points = np.zeros((parametric.shape[0], 3))
+    for idx, (u, v, w) in enumerate(parametric):
+        for i in range(deformer.nx):
+            for j in range(deformer.ny):
+                for k in range(deformer.nz):
+                    weight = (
+                        FFDDeformer._bernstein(deformer.nx - 1, i, u)
+                        * FFDDeformer._bernstein(deformer.ny - 1, j, v)
+                        * FFDDeformer._bernstein(deformer.nz - 1, k, w)
+                    )
+                    points[idx] += weight * deformer.lattice.control_points[i, j, k]
+    return points
+
+
+def test_parametric_to_world_matches_bernstein_sum() -> None:
+    rng = np.random.default_rng(3)
+
+    for shape in [(3, 3, 3), (2, 4, 5)]:
+        deformer = FFDDeformer(*shape)
+        deformer.create_lattice(np.array([-10.0, -5.0, 0.0]), np.array([10.0, 5.0, 20.0]))
+        deformer.lattice.control_points += rng.normal(scale=0.5, size=deformer.lattice.control_points.shape)
+        parametric = rng.uniform(0.0, 1.0, size=(16, 3))
+
+        assert np.allclose(
+            deformer.parametric_to_world(parametric),
+            _reference_world_points(deformer, parametric),
+        )
+
+
+def test_undeformed_lattice_is_identity() -> None:
+    deformer = FFDDeformer()
+    bbox_min = np.array([0.0, 0.0, 0.0])
+    bbox_max = np.array([30.0, 20.0, 10.0])
+    deformer.create_lattice(bbox_min, bbox_max)
+    points = np.array([bbox_min, bbox_max, (bbox_min + bbox_max) / 2.0])
+
+    assert np.allclose(deformer.deform(points, {}), points)
+
+
+def test_deform_batch_matches_individual_deformations() -> None:
+    rng = np.random.default_rng(11)
+    deformer = FFDDeformer()
+    deformer.create_lattice(np.zeros(3), np.array([40.0, 30.0, 20.0]))
+    base_control_points = deformer.lattice.control_points.copy()
+    points = rng.uniform(0.0, 20.0, size=(12, 3))
+    fields = rng.normal(size=(4, 3, 3, 3, 3))
+
+    batch = deformer.deform_batch(points, fields)
+
+    assert batch.shape == (4, 12, 3)
+    assert np.array_equal(deformer.lattice.control_points, base_control_points)
+    for field, deformed in zip(fields, batch):
+        deformer.lattice.control_points = base_control_points + field
+        assert np.allclose(deformer.parametric_to_world(deformer.world_to_parametric(points)), deformed)
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(GeometryError):
+        FFDDeformer(backend="opencl")
+
+
+def test_cupy_backend_matches_numpy_backend() -> None:
+    pytest.importorskip("cupy")
+    rng = np.random.default_rng(13)
+    bbox_min = np.array([-20.0, -10.0, 0.0])
+    bbox_max = np.array([20.0, 10.0, 30.0])
+    points = rng.uniform(bbox_min, bbox_max, size=(64, 3))
+    displacements = {(2, 1, 2): np.array([3.0, 0.0, -1.0]), (0, 0, 0): np.array([0.0, 2.0, 0.0])}
+    fields = rng.normal(size=(3, 3, 3, 3, 3))
+
+    results = []
+    for backend in ("numpy", "cupy"):
+        deformer = FFDDeformer(backend=backend)
+        deformer.create_lattice(bbox_min, bbox_max)
+        batch = deformer.deform_batch(points, fields)
+        results.append((deformer.deform(points, displacements), batch))
+
+    assert np.allclose(results[0][0], results[1][0])
+    assert np.allclose(results[0][1], results[1][1])
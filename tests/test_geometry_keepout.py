@@ -0,0 +1,41 @@
+import numpy as np
+
+from geometry.keepout import build_bins, subtract_box
+from geometry.schema import AABB
+
+
+def _reference_bins(envelope: AABB, keepouts, min_edge_threshold: float = 5.0):
+    bins = [envelope]
+    for ko in keepouts:
+        bins = [piece for b in bins for piece in subtract_box(b, ko)]
+    return [b for b in bins if b.min_edge() >= min_edge_threshold]
+
+
+def test_build_bins_matches_per_box_subtraction() -> None:
+    rng = np.random.default_rng(7)
+    envelope = AABB(min=np.zeros(3), max=np.full(3, 100.0))
+
+    for _ in range(50):
+        keepouts = []
+        for _ in range(int(rng.integers(1, 6))):
+            center = rng.uniform(-10.0, 110.0, 3)
+            size = rng.uniform(5.0, 60.0, 3)
+            keepouts.append(AABB(min=center - size / 2.0, max=center + size / 2.0))
+
+        bins = build_bins(envelope, keepouts)
+        expected = _reference_bins(envelope, keepouts)
+
+        assert len(bins) == len(expected)
+        for got, want in zip(bins, expected):
+            assert np.allclose(got.min, want.min)
+            assert np.allclose(got.max, want.max)
+
+
+def test_build_bins_without_keepouts_returns_envelope() -> None:
+    envelope = AABB(min=np.array([-50.0, -50.0, -50.0]), max=np.array([50.0, 50.0, 50.0]))
+
+    bins = build_bins(envelope, [])
+
+    assert len(bins) == 1
+    assert np.allclose(bins[0].min, envelope.min)
+    assert np.allclose(bins[0].max, envelope.max)
@@ -0,0 +1,164 @@
+import random
+
+import numpy as np
+import pytest
+
+from geometry._aabb_kernels import count_overlaps
+from geometry.packing import compute_overlap_count, multistart_pack
+from geometry.schema import AABB, Part
+
+
+def _placed_part(idx: int, position, dims, face_id: int, bin_index: int, clearance_mm: float = 0.0) -> Part:
+    return Part(
+        id=f"P{idx}",
+        dims=tuple(float(v) for v in dims),
+        mass=1.0,
+        power=1.0,
+        category="avionics",
+        color=(0, 0, 0, 255),
+        clearance_mm=clearance_mm,
+        position=np.asarray(position, dtype=float),
+        bin_index=bin_index,
+        mount_face=face_id,
+    )
+
+
+def _reference_overlap_count(placed) -> int:
+    overlaps = 0
+    eps = 1e-6
+    for i in range(len(placed)):
+        a = placed[i]
+        min_a = a.get_actual_position()
+        max_a = min_a + a.get_actual_dims()
+        for j in range(i + 1, len(placed)):
+            b = placed[j]
+            if a.mount_face == b.mount_face or a.bin_index != b.bin_index:
+                continue
+            min_b = b.get_actual_position()
+            max_b = min_b + b.get_actual_dims()
+            if all(min_a[k] < max_b[k] - eps and min_b[k] < max_a[k] - eps for k in range(3)):
+                overlaps += 1
+    return overlaps
+
+
+def test_compute_overlap_count_matches_pairwise_reference() -> None:
+    rng = np.random.default_rng(5)
+
+    for _ in range(30):
+        placed = []
+        for idx in range(int(rng.integers(0, 120))):
+            face_id = int(rng.integers(0, 6))
+            part = _placed_part(
+                idx,
+                position=rng.integers(0, 80, 3),
+                dims=rng.integers(5, 40, 3),
+                face_id=face_id,
+                bin_index=int(rng.integers(0, 3)),
+                clearance_mm=float(rng.choice([0.0, 2.0, 5.0])),
+            )
+            placed.append(part)
+
+        assert compute_overlap_count(placed) == _reference_overlap_count(placed)
+
+
+def test_touching_parts_do_not_count_as_overlap() -> None:
+    a = _placed_part(0, position=(0, 0, 0), dims=(10, 10, 10), face_id=4, bin_index=0)
+    b = _placed_part(1, position=(10, 0, 0), dims=(10, 10, 10), face_id=0, bin_index=0)
+    c = _placed_part(2, position=(5, 5, 5), dims=(10, 10, 10), face_id=2, bin_index=0)
+
+    placed = [a, b, c]
+
+    assert compute_overlap_count(placed[:2]) == 0
+    assert compute_overlap_count(placed) == 2
+
+
+def test_count_overlaps_matches_brute_force_on_large_bins() -> None:
+    rng = np.random.default_rng(9)
+    n = 200
+    mins = rng.uniform(0.0, 200.0, size=(n, 3))
+    maxs = mins + rng.uniform(5.0, 40.0, size=(n, 3))
+    faces = rng.integers(0, 6, size=n).astype(np.int8)
+    bins = rng.integers(0, 2, size=n).astype(np.int32)
+
+    expected = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if faces[i] == faces[j] or bins[i] != bins[j]:
+                continue
+            if np.all(mins[i] < maxs[j] - 1e-6) and np.all(mins[j] < maxs[i] - 1e-6):
+                expected += 1
+
+    assert count_overlaps(mins, maxs, faces, bins) == expected
+
+
+def test_count_overlaps_integer_coordinates_keep_touching_semantics() -> None:
+    rng = np.random.default_rng(13)
+    n = 150
+    mins = rng.integers(0, 60, size=(n, 3)).astype(float)
+    maxs = mins + rng.integers(1, 12, size=(n, 3))
+    faces = rng.integers(0, 6, size=n).astype(np.int8)
+    bins = np.zeros(n, dtype=np.int32)
+
+    expected = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if faces[i] != faces[j] and np.all(mins[i] < maxs[j]) and np.all(mins[j] < maxs[i]):
+                expected += 1
+
+    assert count_overlaps(mins, maxs, faces, bins) == expected
+    # 非整数坐标回退到浮点路径，结果一致
+    assert count_overlaps(mins + 0.25, maxs + 0.25, faces, bins) == expected
+
+
+def test_multistart_pack_is_independent_of_worker_count() -> None:
+    rng = np.random.default_rng(21)
+    parts = [
+        Part(
+            id=f"P{idx}",
+            dims=tuple(float(v) for v in rng.integers(10, 50, 3)),
+            mass=1.0,
+            power=1.0,
+            category="payload",
+            color=(0, 0, 0, 255),
+            clearance_mm=2.0,
+        )
+        for idx in range(12)
+    ]
+    bins = [AABB(min=np.zeros(3), max=np.full(3, 120.0))]
+
+    results = []
+    for n_jobs in (1, 2):
+        random.seed(1234)
+        result = multistart_pack(parts, bins, clearance_mm=2.0, multistart=3, n_jobs=n_jobs)
+        results.append((
+            result.score,
+            [(p.id, tuple(p.position), p.mount_face) for p in result.placed],
+        ))
+
+    assert results[0] == results[1]
+
+
+def test_part_install_dims_follow_field_updates() -> None:
+    part = _placed_part(0, position=(0, 0, 0), dims=(10, 10, 10), face_id=4, bin_index=0, clearance_mm=2.0)
+    assert np.allclose(part.get_install_dims(4), [12.0, 12.0, 11.0])
+
+    part.clearance_mm = 10.0
+    assert np.allclose(part.get_install_dims(4), [20.0, 20.0, 15.0])
+    assert np.allclose(part.get_actual_position(), [10.0, 10.0, 0.0])
+
+    part.dims = (1.0, 2.0, 3.0)
+    dims = part.get_actual_dims()
+    dims += 1.0
+    assert np.allclose(part.get_actual_dims(), [1.0, 2.0, 3.0])
+
+
+def test_actual_position_tracks_placement_updates() -> None:
+    part = _placed_part(0, position=(0, 0, 0), dims=(10, 10, 10), face_id=5, bin_index=0, clearance_mm=4.0)
+    assert np.allclose(part.get_actual_position(), [4.0, 4.0, 2.0])
+
+    part.position = np.array([100.0, 0.0, 0.0])
+    assert np.allclose(part.get_actual_position(), [104.0, 4.0, 2.0])
+
+    part.mount_face = None
+    with pytest.raises(ValueError):
+        part.get_actual_position()
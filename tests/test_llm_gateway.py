@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+from optimization.llm.gateway import (
+    LLMProviderProfile,
+    _apply_prompt_cache,
+    _extract_cached_tokens,
+    _prompt_cache_enabled,
+)
+
+
+def test_prompt_cache_marks_only_system_messages() -> None:
+    messages = [
+        {"role": "system", "content": "static rules"},
+        {"role": "user", "content": "dynamic state"},
+    ]
+
+    marked = _apply_prompt_cache(messages)
+
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "static rules", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert marked[1] == messages[1]
+    assert messages[0]["content"] == "static rules"
+
+
+def test_prompt_cache_is_opt_in_and_reports_cached_tokens() -> None:
+    profile = LLMProviderProfile(name="p", provider="qwen", api_style="dashscope_generation", model="qwen3-max")
+    assert not _prompt_cache_enabled(profile)
+    profile.provider_options = {"prompt_cache": True}
+    assert _prompt_cache_enabled(profile)
+
+    dashscope_style = {"usage": {"prompt_tokens_details": {"cached_tokens": 1024}}}
+    openai_style = SimpleNamespace(usage=SimpleNamespace(prompt_tokens_details=SimpleNamespace(cached_tokens=256)))
+    assert _extract_cached_tokens(dashscope_style) == 1024
+    assert _extract_cached_tokens(openai_style) == 256
+    assert _extract_cached_tokens(SimpleNamespace(usage=None)) == 0
@@ -0,0 +1,27 @@
+import json
+
+import numpy as np
+import pytest
+
+import core.llm_interaction_store as store_module
+from core.llm_interaction_store import LLMInteractionStore
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_round_trips_sanitized_payload(tmp_path, monkeypatch, use_orjson) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(store_module, "_orjson", None)
+
+    store = LLMInteractionStore(str(tmp_path), run_mode="mass")
+    request = {"messages": [{"role": "user", "content": "布局"}], "values": np.array([1.5, 2.0])}
+    response = {"score": float("nan"), "ids": ("a", "b"), "big": 2 ** 70}
+
+    prefix = store.write(iteration=3, role="intent_modeler", request=request, response=response)
+
+    target = next(tmp_path.rglob(f"{prefix}_req.json")).parent
+    req = json.loads((target / f"{prefix}_req.json").read_text(encoding="utf-8"))
+    resp = json.loads((target / f"{prefix}_resp.json").read_text(encoding="utf-8"))
+    assert req == {"messages": [{"role": "user", "content": "布局"}], "values": [1.5, 2.0]}
+    assert resp == {"score": None, "ids": ["a", "b"], "big": 2 ** 70}
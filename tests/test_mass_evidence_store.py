@@ -0,0 +1,25 @@
+from optimization.knowledge.mass.evidence_schema import MassEvidence
+from optimization.knowledge.mass.evidence_store import MassEvidenceStore
+
+
+def _case(title: str) -> MassEvidence:
+    return MassEvidence.from_dict(
+        {"evidence_id": "", "category": "case", "title": title, "content": f"{title} content"}
+    )
+
+
+def test_add_appends_and_deduplicates_across_reload(tmp_path) -> None:
+    store = MassEvidenceStore(str(tmp_path))
+    baseline = len(store.list())
+
+    first = store.add(_case("iter_001_case"))
+    assert store.add(_case("iter_001_case")).evidence_id == first.evidence_id
+    assert store.add_many([_case("iter_002_case"), _case("iter_001_case")]) == 1
+
+    lines = store.evidence_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == baseline + 2
+
+    reloaded = MassEvidenceStore(str(tmp_path))
+    assert [item.to_dict() for item in reloaded.list()] == [item.to_dict() for item in store.list()]
+    assert reloaded.add(_case("iter_002_case")).title == "iter_002_case"
+    assert len(reloaded.list()) == baseline + 2
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import optimization.knowledge.mass.retrievers as retrievers_module
+from optimization.knowledge.mass.evidence_schema import MassEvidence
+from optimization.knowledge.mass.evidence_store import _default_mass_evidence
+from optimization.knowledge.mass.retrievers import SemanticRetriever, _hash_feature_vector
+
+
+def _context(summary: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        design_state_summary=summary,
+        history_summary="",
+        violations=[],
+        thermal_metrics=SimpleNamespace(hotspot_components=[]),
+    )
+
+
+def test_semantic_retriever_query_cache_is_bounded_lru() -> None:
+    retriever = SemanticRetriever(dim=128, query_cache_size=2)
+
+    first = retriever._query_vector("thermal hotspot spread")
+    assert retriever._query_vector("thermal hotspot spread") is first
+    np.testing.assert_array_equal(first, _hash_feature_vector("thermal hotspot spread", dim=128))
+
+    retriever._query_vector("clearance overlap")
+    retriever._query_vector("thermal hotspot spread")
+    retriever._query_vector("power budget")
+    assert len(retriever._query_cache) == 2
+    assert retriever._query_vector("thermal hotspot spread") is first
+
+
+def test_semantic_retriever_evidence_cache_covers_store_larger_than_query_cache(monkeypatch) -> None:
+    evidences = [
+        MassEvidence.from_dict(
+            {"evidence_id": f"MASS_CASE_{idx:05d}", "category": "case", "title": f"case {idx}", "content": f"thermal {idx}"}
+        )
+        for idx in range(40)
+    ]
+    retriever = SemanticRetriever(dim=128, query_cache_size=2)
+    calls = []
+    real_hash = retrievers_module._hash_feature_vector
+
+    def counting_hash(text, *, dim):
+        calls.append(text)
+        return real_hash(text, dim=dim)
+
+    monkeypatch.setattr(retrievers_module, "_hash_feature_vector", counting_hash)
+
+    retriever.retrieve(evidences, context=_context("thermal"), phase="A", top_k=3)
+    assert len(calls) == len(evidences) + 1
+
+    calls.clear()
+    for summary in ("thermal case", "thermal 7", "thermal 12"):
+        retriever.retrieve(evidences, context=_context(summary), phase="A", top_k=3)
+    assert len(calls) == 3
+
+    calls.clear()
+    extra = MassEvidence.from_dict(
+        {"evidence_id": "MASS_CASE_00041", "category": "case", "title": "radiator", "content": "radiator panel"}
+    )
+    got = retriever.retrieve(evidences + [extra], context=_context("radiator panel"), phase="A", top_k=1)
+    assert len(calls) == 2
+    assert got[0].evidence.evidence_id == "MASS_CASE_00041"
+
+
+def test_semantic_retriever_results_match_uncached() -> None:
+    evidences = _default_mass_evidence()
+    context = _context("thermal clearance violated, reflection strict relaxed")
+
+    cached = SemanticRetriever(dim=512)
+    uncached = SemanticRetriever(dim=512, query_cache_size=0)
+    for _ in range(2):
+        got = cached.retrieve(evidences, context=context, phase="A", top_k=3)
+        expected = uncached.retrieve(evidences, context=context, phase="A", top_k=3)
+        assert [c.evidence.evidence_id for c in got] == [c.evidence.evidence_id for c in expected]
+        assert [c.score for c in got] == [c.score for c in expected]
+
+
+def test_semantic_retriever_top_k_matches_full_stable_sort() -> None:
+    evidences = _default_mass_evidence() * 3
+    context = _context("thermal clearance hotspot overlap strict feasible")
+    retriever = SemanticRetriever(dim=512)
+
+    query_vec = _hash_feature_vector(retriever._build_query_text(context=context, phase="B"), dim=512)
+    scored = [
+        (float(_hash_feature_vector(item.as_retrieval_text(), dim=512) @ query_vec), idx)
+        for idx, item in enumerate(evidences)
+    ]
+    expected = sorted([pair for pair in scored if pair[0] > 0.0], key=lambda pair: pair[0], reverse=True)
+
+    for top_k in (0, 1, 4, 7, 100):
+        got = retriever.retrieve(evidences, context=context, phase="B", top_k=top_k)
+        assert [(c.evidence.evidence_id, c.score) for c in got] == [
+            (evidences[idx].evidence_id, score) for score, idx in expected[:top_k]
+        ]